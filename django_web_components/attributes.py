@@ -1,14 +1,26 @@
+import re
+from functools import lru_cache
+from html import escape
 from typing import Tuple, Union
 
-from django.utils.html import format_html, conditional_escape
-from django.utils.safestring import mark_safe, SafeString
+from django.utils.safestring import SafeString
+
+EMPTY_SAFE_STRING = SafeString("")
+
+# Matches any character that may need escaping in an attribute name
+unsafe_attribute_name_re = re.compile(r"[^\w\-\:\@\.]")
 
 
 class AttributeBag(dict):
+    # a new AttributeBag is created on every render, so avoid the per-instance __dict__
+    __slots__ = ()
+
     def __str__(self):
         """
         Convert the attributes into a single HTML string.
         """
+        if not self:
+            return EMPTY_SAFE_STRING
         return attributes_to_string(self)
 
 
@@ -16,17 +28,49 @@ def attributes_to_string(attributes: dict) -> str:
     """
     Convert a dict of attributes to a string.
     """
-    attr_list = []
+    if not attributes:
+        return EMPTY_SAFE_STRING
+
+    parts = []
+    # bind the helpers locally, they are looked up for every attribute
+    append = parts.append
+    escape_name = escape_attribute_name
+    escape_value = escape_attribute
 
     for key, value in attributes.items():
         if value is None or value is False:
             continue
         if value is True:
-            attr_list.append(conditional_escape(key))
+            append(escape_name(key))
         else:
-            attr_list.append(format_html('{}="{}"', key, value))
+            append(f'{escape_name(key)}="{escape_value(value)}"')
 
-    return mark_safe(SafeString(" ").join(attr_list))
+    return SafeString(" ".join(parts))
+
+
+def escape_attribute(value) -> str:
+    """
+    HTML-escapes the given value, unless it is already marked as safe.
+    """
+    if hasattr(value, "__html__"):
+        return value.__html__()
+    return escape(str(value), quote=True)
+
+
+def escape_attribute_name(name) -> str:
+    """
+    HTML-escapes the given attribute name, skipping the escaping for names that only contain safe characters.
+    """
+    if type(name) is str:
+        return _escape_str_name(name)
+    return escape_attribute(name)
+
+
+@lru_cache(maxsize=1024)
+def _escape_str_name(name: str) -> str:
+    if unsafe_attribute_name_re.search(name) is None:
+        return name
+    return escape(name, quote=True)
 
 
 def merge_attributes(*args: dict) -> dict:
@@ -39,20 +83,51 @@ def merge_attributes(*args: dict) -> dict:
     - "class" values are normalized / concatenated
     - Other values are added to the final dictionary as is
     """
+    args = [to_merge for to_merge in args if to_merge]
+
+    # fast path, nothing to merge or normalize
+    if not args:
+        return AttributeBag()
+    if len(args) == 1 and not needs_normalization(args[0]):
+        return AttributeBag(args[0])
+
     result = AttributeBag()
 
     for to_merge in args:
+        # nothing to normalize, let dict.update do the merge
+        if not needs_normalization(to_merge):
+            result.update(to_merge)
+            continue
+
         for key, value in to_merge.items():
             if key == "class":
                 klass = result.get("class")
-                if klass != value:
-                    result["class"] = normalize_class([klass, value])
+                if klass == value:
+                    # nothing to merge, this also keeps a `None` class from being added when there is none yet
+                    continue
+                if not klass:
+                    result["class"] = normalize_class(value)
+                elif value:
+                    if isinstance(value, str):
+                        # the existing class is already normalized, so the strings can be joined directly
+                        value = value.strip()
+                        result["class"] = f"{klass} {value}" if value else klass
+                    else:
+                        result["class"] = normalize_class([klass, value])
             elif key != "":
                 result[key] = value
 
     return result
 
 
+def needs_normalization(attrs: dict) -> bool:
+    """
+    Returns whether merging the given attributes requires more than a plain dict update,
+    i.e. they contain a "class" attribute or an empty attribute name.
+    """
+    return "class" in attrs or "" in attrs
+
+
 def append_attributes(*args: dict) -> dict:
     """
     Merges the input dictionaries and returns a new dictionary.
@@ -60,6 +135,14 @@ def append_attributes(*args: dict) -> dict:
     If a key is present in multiple dictionaries, its values are concatenated with a space character
     as separator in the final dictionary.
     """
+    args = [to_merge for to_merge in args if to_merge]
+
+    # fast path, nothing to append
+    if not args:
+        return AttributeBag()
+    if len(args) == 1:
+        return AttributeBag(args[0])
+
     result = AttributeBag()
 
     for to_merge in args:
@@ -85,35 +168,42 @@ def normalize_class(value: Union[str, list, tuple, dict]) -> str:
     - If the input value is a dictionary, its keys are concatenated with a space character as separator
       only if their corresponding values are truthy.
     """
-    result = ""
-
+    # fast path, plain strings are the most common class values
     if isinstance(value, str):
-        result = value
-    elif isinstance(value, (list, tuple)):
-        for v in value:
-            normalized = normalize_class(v)
-            if normalized:
-                result += normalized + " "
-    elif isinstance(value, dict):
-        for key, val in value.items():
-            if val:
-                result += key + " "
-
-    return result.strip()
+        return value.strip()
+
+    parts = []
+    stack = [value]
+
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            value = value.strip()
+            if value:
+                parts.append(value)
+        elif isinstance(value, (list, tuple)):
+            # push in reverse order so that the elements are processed in order
+            stack.extend(reversed(value))
+        elif isinstance(value, dict):
+            for key, val in value.items():
+                if val:
+                    key = key.strip()
+                    if key:
+                        parts.append(key)
+
+    return " ".join(parts)
 
 
 def split_attributes(attributes: dict) -> Tuple[dict, dict]:
     """
     Splits the given attributes into "special" attributes (like :let) and normal attributes.
+
+    If there are no special attributes, the given dict is returned as is, so callers must not mutate it.
     """
-    special_attrs = (":let",)
+    if ":let" not in attributes:
+        return {}, attributes
 
-    attrs = {}
-    special = {}
-    for key, value in attributes.items():
-        if key in special_attrs:
-            special[key] = value
-        else:
-            attrs[key] = value
+    special = {":let": attributes[":let"]}
+    attrs = {key: value for key, value in attributes.items() if key != ":let"}
 
     return special, attrs
@@ -4,10 +4,11 @@ from typing import Union
 from django import template
 from django.core.exceptions import ImproperlyConfigured
 from django.template import loader
+from django.utils.safestring import SafeString
 
 from django_web_components.attributes import AttributeBag
 from django_web_components.registry import ComponentRegistry
-from django_web_components.tag_formatter import get_component_tag_formatter
+from django_web_components.tag_formatter import get_component_tag_names
 
 
 class Component:
@@ -42,40 +43,83 @@ class Component:
         return loader.render_to_string(template_name, context.flatten())
 
 
-def render_component(*, name: str, attributes: dict, slots: dict, context: template.Context) -> str:
+def render_component(*, name: str, attributes: dict, slots: dict, context: template.Context = None) -> str:
     """
     Render the component with the given name.
+
+    If no context is passed, the component is rendered with an empty one.
+    """
+    if context is None:
+        # the components push onto the context while rendering, so it can't be shared between renders
+        context = template.Context()
+    return registry.get_renderer(name)(attributes, slots, context)
+
+
+def make_component_renderer(component_class):
     """
-    extra_context = {
-        "attributes": attributes,
-        "slots": slots,
-    }
+    Returns a function which renders the given component with the given attributes, slots and context.
 
-    component_class = registry.get(name)
+    The function / class based component check is done once here, instead of on every render.
+    """
 
     # handle function components
     if isinstance(component_class, FunctionType):
-        with context.push(extra_context):
-            return component_class(context)
+
+        def render_function_component(attributes: dict, slots: dict, context: template.Context) -> str:
+            with context.push(attributes=attributes, slots=slots):
+                return component_class(context)
+
+        return render_function_component
 
     # handle class based components
-    component = component_class(
-        attributes=attributes,
-        slots=slots,
-    )
-    extra_context.update(component.get_context_data())
+    def render_class_component(attributes: dict, slots: dict, context: template.Context) -> str:
+        component = component_class(
+            attributes=attributes,
+            slots=slots,
+        )
+
+        # the component's context data takes precedence over the attributes and slots
+        with context.push({"attributes": attributes, "slots": slots, **component.get_context_data()}):
+            return component.render(context)
 
-    with context.push(extra_context):
-        return component.render(context)
+    return render_class_component
 
 
 # Global component registry
-registry = ComponentRegistry()
+registry = ComponentRegistry(renderer_factory=make_component_renderer)
 
 
-def register(name=None, component=None, target_register: template.Library = None):
+def template_component(template_string: str):
+    """
+    Returns a function component which renders the given template string.
+
+    The template is compiled the first time the component is rendered, and reused afterwards.
+    """
+    # templates without any tags or variables always render to the template string itself
+    if not any(tag in template_string for tag in ("{%", "{{", "{#")):
+        output = SafeString(template_string)
+
+        def render_static(context: template.Context) -> str:
+            return output
+
+        return render_static
+
+    compiled = None
+
+    def render(context: template.Context) -> str:
+        nonlocal compiled
+        if compiled is None:
+            compiled = template.Template(template_string)
+        return compiled.render(context)
+
+    return render
+
+
+def register(name=None, component=None, target_register: template.Library = None, template_string: str = None):
     """
     Register a component.
+
+    If `template_string` is passed instead of a component, the component will simply render the template string.
     """
     from django_web_components.templatetags.components import (
         register as tag_register,
@@ -85,6 +129,12 @@ def register(name=None, component=None, target_register: template.Library = None
     if target_register is None:
         target_register = tag_register
 
+    if template_string is not None:
+        # register("alert", template_string="...")
+        if not isinstance(name, str) or component is not None:
+            raise ValueError("component.register requires a name and no component when passing a template_string")
+        return _register(name=name, component=template_component(template_string), target_register=target_register)
+
     def decorator(component):
         return _register(name=component.__name__, component=component, target_register=target_register)
 
@@ -119,12 +169,13 @@ def _register(name: str, component, target_register: template.Library):
     # add the component to the registry
     registry.register(name=name, component=component)
 
-    formatter = get_component_tag_formatter()
+    inline_tag, block_start_tag, _ = get_component_tag_names(name)
+    compile_function = create_component_tag(name)
 
     # register the inline tag
-    target_register.tag(formatter.format_inline_tag(name), create_component_tag(name))
+    target_register.tag(inline_tag, compile_function)
 
     # register the block tag
-    target_register.tag(formatter.format_block_start_tag(name), create_component_tag(name))
+    target_register.tag(block_start_tag, compile_function)
 
     return component
@@ -1,23 +1,49 @@
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 SETTINGS_KEY = "WEB_COMPONENTS"
 
 DEFAULT_SLOT_NAME = "inner_block"
 DEFAULT_COMPONENT_TAG_FORMATTER = "django_web_components.tag_formatter.ComponentTagFormatter"
+TEMPLATE_CACHE_SIZE = 512
 
 
 class AppSettings:
+    def __init__(self):
+        self._cache = {}
+
     @property
     def settings(self):
         return getattr(settings, SETTINGS_KEY, {})
 
+    def _get(self, name: str, default):
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = self.settings.get(name, default)
+            return value
+
+    def clear_cache(self):
+        self._cache.clear()
+
     @property
     def DEFAULT_SLOT_NAME(self):
-        return self.settings.get("DEFAULT_SLOT_NAME", DEFAULT_SLOT_NAME)
+        return self._get("DEFAULT_SLOT_NAME", DEFAULT_SLOT_NAME)
 
     @property
     def DEFAULT_COMPONENT_TAG_FORMATTER(self):
-        return self.settings.get("DEFAULT_COMPONENT_TAG_FORMATTER", DEFAULT_COMPONENT_TAG_FORMATTER)
+        return self._get("DEFAULT_COMPONENT_TAG_FORMATTER", DEFAULT_COMPONENT_TAG_FORMATTER)
+
+    @property
+    def TEMPLATE_CACHE_SIZE(self):
+        return self._get("TEMPLATE_CACHE_SIZE", TEMPLATE_CACHE_SIZE)
 
 
 app_settings = AppSettings()
+
+
+@receiver(setting_changed)
+def clear_app_settings_cache(*, setting, **kwargs):
+    if setting == SETTINGS_KEY:
+        app_settings.clear_cache()
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Callable
 
 
 class AlreadyRegistered(Exception):
@@ -9,29 +10,59 @@ class NotRegistered(Exception):
     pass
 
 
+_MISSING = object()
+
+
 class ComponentRegistry:
-    def __init__(self):
+    def __init__(self, renderer_factory: Callable[[Any], Callable] = None):
         self._registry: Dict[str, Any] = {}
+        # Renderers are built once, when the component is registered, so that
+        # the per-render dispatch on the component type can be skipped
+        self._renderers: Dict[str, Callable] = {}
+        self._renderer_factory = renderer_factory
 
     def register(self, name: str = None, component: Any = None):
-        if name in self._registry:
+        # the component nodes intern the same names, so the lookups on render match by identity
+        if type(name) is str:
+            name = sys.intern(name)
+
+        # setdefault leaves the registry untouched if the name is already taken
+        size = len(self._registry)
+        self._registry.setdefault(name, component)
+        if len(self._registry) == size:
             raise AlreadyRegistered('The component "%s" is already registered' % name)
 
-        self._registry[name] = component
+        if self._renderer_factory is not None:
+            self._renderers[name] = self._renderer_factory(component)
 
     def unregister(self, name):
-        self.get(name)
+        try:
+            del self._registry[name]
+        except KeyError:
+            raise NotRegistered('The component "%s" is not registered' % name) from None
 
-        del self._registry[name]
+        self._renderers.pop(name, None)
 
     def get(self, name) -> Any:
-        if name not in self._registry:
+        component = self._registry.get(name, _MISSING)
+        if component is _MISSING:
+            raise NotRegistered('The component "%s" is not registered' % name)
+
+        return component
+
+    def get_renderer(self, name) -> Callable:
+        """
+        Returns the renderer built by the registry's `renderer_factory` for the component with the given name.
+        """
+        renderer = self._renderers.get(name, _MISSING)
+        if renderer is _MISSING:
             raise NotRegistered('The component "%s" is not registered' % name)
 
-        return self._registry[name]
+        return renderer
 
     def all(self) -> Dict[str, Any]:
         return self._registry
 
     def clear(self):
         self._registry = {}
+        self._renderers = {}
@@ -1,6 +1,11 @@
+from functools import lru_cache
+from typing import Tuple
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 
-from django_web_components.conf import app_settings
+from django_web_components.conf import SETTINGS_KEY, app_settings
 
 
 class ComponentTagFormatter:
@@ -27,8 +32,30 @@ class ComponentTagFormatter:
         return f"#{name}"
 
 
+@lru_cache(maxsize=1)
 def get_component_tag_formatter():
     """
     Returns an instance of the currently configured component tag formatter.
     """
     return import_string(app_settings.DEFAULT_COMPONENT_TAG_FORMATTER)()
+
+
+@lru_cache(maxsize=None)
+def get_component_tag_names(name: str) -> Tuple[str, str, str]:
+    """
+    Returns the inline tag, block start tag and block end tag of the component with the given name,
+    as formatted by the currently configured component tag formatter.
+    """
+    formatter = get_component_tag_formatter()
+    return (
+        formatter.format_inline_tag(name),
+        formatter.format_block_start_tag(name),
+        formatter.format_block_end_tag(name),
+    )
+
+
+@receiver(setting_changed)
+def clear_component_tag_formatter_cache(*, setting, **kwargs):
+    if setting == SETTINGS_KEY:
+        get_component_tag_formatter.cache_clear()
+        get_component_tag_names.cache_clear()
@@ -1,6 +1,75 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.template import Template
 
-template_cache = {}
+from django_web_components.conf import SETTINGS_KEY, app_settings
+
+
+class TemplateCache(OrderedDict):
+    """
+    A dict of the named templates, which discards the least recently used templates
+    once it holds more than `TEMPLATE_CACHE_SIZE` templates. A size of None means the cache is unbounded,
+    just like `lru_cache(maxsize=None)`.
+
+    Reads also reorder the dict, and the cache is shared by all rendering threads, so lookups and
+    insertions hold a lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # reentrant, since OrderedDict.popitem looks the item up again through __getitem__ on subclasses
+        self._lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            maxsize = app_settings.TEMPLATE_CACHE_SIZE
+            if maxsize is None:
+                return
+            while len(self) > maxsize:
+                self.popitem(last=False)
+
+
+template_cache = TemplateCache()
+
+
+def compile_template(template_string, engine=None) -> Template:
+    """
+    Compiles the given template string, reusing the result for identical template strings.
+
+    At most `TEMPLATE_CACHE_SIZE` templates are kept, the least recently used ones are discarded first.
+    """
+    return get_template_compiler()(template_string, engine)
+
+
+@lru_cache(maxsize=1)
+def get_template_compiler():
+    """
+    Returns the cached template compiling function, sized according to the `TEMPLATE_CACHE_SIZE` setting.
+    """
+
+    @lru_cache(maxsize=app_settings.TEMPLATE_CACHE_SIZE)
+    def compile(template_string, engine=None) -> Template:
+        return Template(template_string, engine=engine)
+
+    return compile
+
+
+@receiver(setting_changed)
+def clear_template_compiler_cache(*, setting, **kwargs):
+    if setting == SETTINGS_KEY:
+        get_template_compiler.cache_clear()
 
 
 class CachedTemplate:
@@ -13,12 +82,15 @@ class CachedTemplate:
     def render(self, context):
         key = self.name
 
-        if key in template_cache:
-            return template_cache[key].render(context)
-
-        template = Template(self.template_string, self.origin, self.name, self.engine)
+        if key is None:
+            # anonymous templates are cached by their contents
+            if self.origin is None:
+                return compile_template(self.template_string, self.engine).render(context)
+            return Template(self.template_string, self.origin, self.name, self.engine).render(context)
 
-        if key is not None:
-            template_cache[key] = template
+        try:
+            template = template_cache[key]
+        except KeyError:
+            template = template_cache[key] = Template(self.template_string, self.origin, self.name, self.engine)
 
         return template.render(context)
@@ -1,10 +1,13 @@
 import re
-from typing import Union
+import sys
+from collections import defaultdict
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Tuple, Union
 
 from django import template
 from django.template import TemplateSyntaxError, NodeList
-from django.template.base import FilterExpression, Token, Parser
-from django.utils.regex_helper import _lazy_re_compile
+from django.template.base import FilterExpression, Token, Parser, TextNode
 from django.utils.safestring import SafeString
 
 from django_web_components.attributes import (
@@ -13,69 +16,83 @@ from django_web_components.attributes import (
     merge_attributes,
     split_attributes,
     append_attributes,
+    needs_normalization,
 )
-from django_web_components.component import (
-    render_component,
-    get_component_tag_formatter,
-)
+from django_web_components.component import render_component
+from django_web_components.tag_formatter import get_component_tag_names
 from django_web_components.conf import app_settings
-from django_web_components.utils import token_kwargs
+from django_web_components.utils import compile_filter, get_literal_value, is_kwarg_key, token_kwargs
 
 register = template.Library()
 
+_MISSING = object()
+
+# Maps the ids of the SlotNodes passed to the components currently being rendered
+# to their resolved attributes. The default is read-only, since it is shared by every context.
+resolved_slot_attributes: ContextVar[Mapping] = ContextVar("resolved_slot_attributes", default=MappingProxyType({}))
+
+
+def resolve_attributes(literal_attributes: dict, dynamic_attributes: list, context) -> AttributeBag:
+    """
+    Resolves the attributes split by `split_literal_attributes`. The values known at parse time are copied as is,
+    and only the remaining FilterExpressions are resolved against the context.
+    """
+    attributes = AttributeBag(literal_attributes)
+    setitem = attributes.__setitem__
+    for key, value in dynamic_attributes:
+        setitem(key, value.resolve(context))
+    return attributes
+
 
 def create_component_tag(component_name: str):
+    # The tag names only depend on the component name, so format them once, along with the
+    # tag the component is registered with
+    _, block_start_tag, block_end_tag = get_component_tag_names(component_name)
+    parse_until = (block_end_tag,)
+
     def do_component(parser: Parser, token: Token):
         tag_name, *remaining_bits = token.split_contents()
 
-        formatter = get_component_tag_formatter()
-
         # If this is a block tag, expect the closing tag
-        if tag_name == formatter.format_block_start_tag(component_name):
-            nodelist = parser.parse((formatter.format_block_end_tag(component_name),))
+        if tag_name == block_start_tag:
+            nodelist = parser.parse(parse_until)
             parser.delete_first_token()
         else:
             nodelist = NodeList()
 
         # Bits that are not keyword args are interpreted as `True` values
-        all_bits = [bit if "=" in bit else f"{bit}=True" for bit in remaining_bits]
-        raw_attributes = token_kwargs(all_bits, parser)
+        raw_attributes = token_kwargs(remaining_bits, parser, allow_bare=True)
         special, attrs = split_attributes(raw_attributes)
 
-        # process the slots
-        slots = {}
+        # process the slots, making sure the default slot comes first
+        default_slot_name = sys.intern(app_settings.DEFAULT_SLOT_NAME)
+        slots = defaultdict(SlotNodeList)
+        slots[default_slot_name] = SlotNodeList()
 
         # All child nodes that are not inside a slot will be added to a default slot
-        default_slot_name = app_settings.DEFAULT_SLOT_NAME
-        default_slot = SlotNode(
-            name=default_slot_name,
-            nodelist=NodeList(),
-            unresolved_attributes={},
-            special=special,
-        )
-        slots[default_slot_name] = SlotNodeList()
+        default_nodelist = NodeList()
 
         for node in nodelist:
-            if isinstance(node, SlotNode):
-                slot_name = node.name
-
-                # initialize the slot
-                if slot_name not in slots:
-                    slots[slot_name] = SlotNodeList()
-
-                slots[slot_name].append(node)
+            if type(node) is SlotNode:
+                slots[node.name].append(node)
             else:
-                # otherwise add the node to the default slot
-                default_slot.nodelist.append(node)
+                default_nodelist.append(node)
 
         # add the default slot only if it's not empty
-        if len(default_slot.nodelist) > 0:
+        if default_nodelist:
+            default_slot = SlotNode(
+                name=default_slot_name,
+                nodelist=default_nodelist,
+                unresolved_attributes={},
+                special=special,
+            )
+            default_slot.static_output = get_static_output(default_nodelist)
             slots[default_slot_name].append(default_slot)
 
         return ComponentNode(
             name=component_name,
             unresolved_attributes=attrs,
-            slots=slots,
+            slots=dict(slots),
         )
 
     return do_component
@@ -87,46 +104,50 @@ class ComponentNode(template.Node):
     slots: dict
 
     def __init__(self, name: str = None, unresolved_attributes: dict = None, slots: dict = None):
-        self.name = name or ""
+        # interned, just like the names in the registry, so the renderer lookup matches by identity
+        self.name = sys.intern(name) if name else ""
         self.unresolved_attributes = unresolved_attributes or {}
+        self.literal_attributes, self.dynamic_attributes = split_literal_attributes(self.unresolved_attributes.items())
         self.slots = slots or {}
+        # the SlotNodes whose attributes need to be resolved on each render, collected once
+        # instead of walking every slot list on each render
+        self.slot_nodes = [
+            slot for slot_list in self.slots.values() for slot in slot_list if isinstance(slot, SlotNode)
+        ]
 
     def render(self, context):
         # We may need to access the slot's attributes inside the component's template,
         # so we need to resolve them
         #
-        # We also clone the SlotNodes to make sure we don't have thread-safety issues since
-        # we are storing the attributes on the node itself
-        slots = {}
-        for slot_name, slot_list in self.slots.items():
-            # initialize the slot
-            if slot_name not in slots:
-                slots[slot_name] = SlotNodeList()
-
-            for slot in slot_list:
-                if isinstance(slot, SlotNode):
-                    # clone the SlotNode
-                    cloned_slot = SlotNode(
-                        name=slot.name,
-                        nodelist=slot.nodelist,
-                        unresolved_attributes=slot.unresolved_attributes,
-                        special=slot.special,
-                    )
-                    # resolve its attributes so that they can be accessed from the component template
-                    cloned_slot.resolve_attributes(context)
-
-                    slots[slot_name].append(cloned_slot)
-                else:
-                    slots[slot_name].append(slot)
-
-        attributes = AttributeBag({key: value.resolve(context) for key, value in self.unresolved_attributes.items()})
-
-        return render_component(
-            name=self.name,
-            attributes=attributes,
-            slots=slots,
-            context=context,
-        )
+        # The resolved attributes are stored in a context variable instead of on the nodes
+        # themselves, to make sure we don't have thread-safety issues
+        #
+        # Components without any slots have nothing to add, so they skip this entirely
+        resolved_attributes = None
+        if self.slot_nodes:
+            resolved_attributes = dict(resolved_slot_attributes.get())
+            for slot in self.slot_nodes:
+                resolved_attributes[id(slot)] = slot.get_resolved_attributes(context)
+
+        # components are free to modify their attributes, so even without any attributes
+        # they each get their own AttributeBag
+        if self.unresolved_attributes:
+            attributes = resolve_attributes(self.literal_attributes, self.dynamic_attributes, context)
+        else:
+            attributes = AttributeBag()
+
+        # components are also free to modify their slots, so they each get their own lists instead
+        # of the ones built at parse time, which are shared between renders
+        slots = {name: SlotNodeList(slot_list) for name, slot_list in self.slots.items()}
+
+        if resolved_attributes is None:
+            return render_component(name=self.name, attributes=attributes, slots=slots, context=context)
+
+        token = resolved_slot_attributes.set(resolved_attributes)
+        try:
+            return render_component(name=self.name, attributes=attributes, slots=slots, context=context)
+        finally:
+            resolved_slot_attributes.reset(token)
 
 
 @register.tag("slot")
@@ -136,63 +157,125 @@ def do_slot(parser: Parser, token: Token):
     if len(remaining_bits) < 1:
         raise TemplateSyntaxError("'%s' tag takes at least one argument, the slot name" % tag_name)
 
-    slot_name = remaining_bits.pop(0).strip('"')
+    slot_name = remaining_bits.pop(0)
+    # the name may be quoted, e.g. {% slot "title" %} or {% slot 'title' %}
+    if len(slot_name) >= 2 and slot_name[0] in "\"'" and slot_name[-1] == slot_name[0]:
+        slot_name = slot_name[1:-1]
+    if not slot_name:
+        raise TemplateSyntaxError("'%s' tag requires a non-empty slot name" % tag_name)
+    # slot names are used as the keys of every component's slots dict, so intern them
+    slot_name = sys.intern(slot_name)
 
     # Bits that are not keyword args are interpreted as `True` values
-    all_bits = [bit if "=" in bit else f"{bit}=True" for bit in remaining_bits]
-    raw_attributes = token_kwargs(all_bits, parser)
+    raw_attributes = token_kwargs(remaining_bits, parser, allow_bare=True)
     special, attrs = split_attributes(raw_attributes)
 
     nodelist = parser.parse(("endslot",))
     parser.delete_first_token()
 
-    return SlotNode(
+    slot = SlotNode(
         name=slot_name,
         nodelist=nodelist,
         unresolved_attributes=attrs,
         special=special,
     )
+    slot.static_output = get_static_output(nodelist)
+    return slot
+
+
+def get_static_output(nodelist: NodeList) -> Optional[SafeString]:
+    """
+    Returns the output of a nodelist containing only text, which is the same on every render, or None if the
+    nodelist contains any other node. Only meant to be called at parse time, once the nodelist is complete.
+    """
+    if all(type(node) is TextNode for node in nodelist):
+        return SafeString("".join(node.s for node in nodelist))
+    return None
 
 
 class SlotNode(template.Node):
     name: str
     nodelist: NodeList
     unresolved_attributes: dict
-    attributes: dict
     special: dict
+    let: Union[FilterExpression, None]
 
     def __init__(
-        self, name: str = None, nodelist: NodeList = None, unresolved_attributes: dict = None, special: dict = None
+        self,
+        name: str = None,
+        nodelist: NodeList = None,
+        unresolved_attributes: dict = None,
+        special: dict = None,
+        resolved_attributes: dict = None,
     ):
         self.name = name or ""
         self.nodelist = nodelist or NodeList()
         self.unresolved_attributes = unresolved_attributes or {}
+        self.literal_attributes, self.dynamic_attributes = split_literal_attributes(self.unresolved_attributes.items())
         self.special = special or {}
-        # Will be set by the ComponentNode
-        self.attributes = AttributeBag()
+        # looked up once here, since it's needed every time the slot is rendered
+        self.let = self.special.get(":let")
+        # set by the tag parsers once the nodelist is complete, see `get_static_output`
+        self.static_output = None
+        self._attributes = resolved_attributes
+
+    @property
+    def attributes(self) -> dict:
+        attributes = self._get_attributes()
+        return AttributeBag() if attributes is None else attributes
+
+    def _get_attributes(self):
+        # Attributes resolved by the ComponentNode currently being rendered take precedence
+        attributes = resolved_slot_attributes.get().get(id(self))
+        if attributes is None:
+            attributes = self._attributes
+        return attributes
+
+    def get_resolved_attributes(self, context) -> AttributeBag:
+        return resolve_attributes(self.literal_attributes, self.dynamic_attributes, context)
 
     def resolve_attributes(self, context):
-        self.attributes = AttributeBag(
-            {key: value.resolve(context) for key, value in self.unresolved_attributes.items()}
-        )
+        self._attributes = self.get_resolved_attributes(context)
 
     def render(self, context):
-        attributes = AttributeBag({key: value.resolve(context) for key, value in self.unresolved_attributes.items()})
+        if self.static_output is not None:
+            return self.static_output
+
+        if self.dynamic_attributes:
+            # dynamic attributes may depend on variables only available while the slot is rendered,
+            # e.g. the `:let` argument or the component template's own variables, so they are resolved
+            # again against the current context
+            attributes = self.get_resolved_attributes(context)
+        else:
+            # the attributes may have already been resolved by the ComponentNode
+            attributes = self._get_attributes()
+            if attributes is None:
+                attributes = self.get_resolved_attributes(context)
 
         extra_context = {
             "attributes": attributes,
         }
 
-        with context.update(extra_context):
+        # push the dict directly instead of going through `context.update()`, which wraps it
+        # in a ContextDict and a context manager on every render
+        context.dicts.append(extra_context)
+        try:
             return self.nodelist.render(context)
+        finally:
+            context.dicts.pop()
 
 
 class SlotNodeList(NodeList):
     @property
     def attributes(self) -> dict:
-        if len(self) == 1 and hasattr(self[0], "attributes"):
-            return self[0].attributes
-        return AttributeBag()
+        if len(self) != 1:
+            return AttributeBag()
+        node = self[0]
+        # slot lists almost always hold a SlotNode, which is checked directly instead of probing for the attribute
+        if type(node) is SlotNode:
+            return node.attributes
+        attributes = getattr(node, "attributes", _MISSING)
+        return AttributeBag() if attributes is _MISSING else attributes
 
 
 @register.tag("render_slot")
@@ -230,30 +313,33 @@ class RenderSlotNode(template.Node):
             return ""
 
         if isinstance(slot, NodeList):
-            return SafeString("".join([self.render_slot(node, argument, context) for node in slot]))
+            return SafeString("".join(self.render_slot(node, argument, context) for node in slot))
 
         return self.render_slot(slot, argument, context)
 
     def render_slot(self, slot, argument, context):
         if isinstance(slot, SlotNode):
-            let = slot.special.get(":let", None)
+            # text-only slots don't use the context, so there is no need to resolve :let or push the argument
+            if slot.static_output is not None:
+                return slot.static_output
+
+            let = slot.let
             if let:
                 let = let.resolve(context, ignore_failures=True)
 
             # if we were passed an argument and the :let attribute is defined,
             # add the argument to the context with the new name
             if let and argument:
-                with context.update(
-                    {
-                        let: argument,
-                    }
-                ):
+                context.dicts.append({let: argument})
+                try:
                     return slot.render(context)
+                finally:
+                    context.dicts.pop()
 
         return slot.render(context)
 
 
-attribute_re = _lazy_re_compile(
+attribute_re = re.compile(
     r"""
     (?P<attr>
         [\w\-\:\@\.\_]+
@@ -270,6 +356,30 @@ attribute_re = _lazy_re_compile(
     re.VERBOSE | re.UNICODE,
 )
 
+_attribute_match = attribute_re.match
+
+
+def split_attribute(pair: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Splits an `attr="value"` or `attr+="value"` pair into the attribute name, sign and value,
+    or returns None if the pair is malformed.
+    """
+    # fast path, the attribute name is valid and the value doesn't contain any inner quotes,
+    # so we don't need to run the regex
+    key, sep, value = pair.partition("=")
+    if sep and value and not any(quote in value[1:-1] for quote in "\"'"):
+        if key.endswith("+"):
+            key, sign = key[:-1], "+="
+        else:
+            sign = "="
+        if is_kwarg_key(key):
+            return key, sign, value
+
+    match = _attribute_match(pair)
+    if not match:
+        return None
+    return match["attr"], match["sign"], match["value"]
+
 
 @register.tag("merge_attrs")
 def do_merge_attrs(parser: Parser, token: Token):
@@ -283,17 +393,13 @@ def do_merge_attrs(parser: Parser, token: Token):
     default_attrs = []
     append_attrs = []
     for pair in attr_list:
-        match = attribute_re.match(pair)
-        if not match:
+        split = split_attribute(pair)
+        if split is None:
             raise TemplateSyntaxError(
                 "Malformed arguments to '%s' tag. You must pass the attributes in the form attr=\"value\"." % tag_name
             )
-        dct = match.groupdict()
-        attr, sign, value = (
-            dct["attr"],
-            dct["sign"],
-            parser.compile_filter(dct["value"]),
-        )
+        attr, sign, value = split
+        attr, value = sys.intern(attr), compile_filter(value, parser)
         if sign == "=":
             default_attrs.append((attr, value))
         elif sign == "+=":
@@ -304,23 +410,61 @@ def do_merge_attrs(parser: Parser, token: Token):
     return MergeAttrsNode(attributes, default_attrs, append_attrs)
 
 
+def split_literal_attributes(attrs: Iterable[Tuple[str, FilterExpression]]) -> Tuple[dict, list]:
+    """
+    Splits the given (attr, FilterExpression) pairs into a dict of the values which can be resolved at
+    parse time, and a list of the pairs which need to be resolved against the context.
+
+    The dict also contains a placeholder for each of the dynamic attributes, so that copying it and filling
+    in the dynamic values keeps the attributes in the order they were defined in.
+    """
+    literals = {}
+    dynamic = {}
+    for attr, value in attrs:
+        literal = get_literal_value(value)
+        if literal is None:
+            literals[attr] = None
+            dynamic[attr] = value
+        else:
+            literals[attr] = literal
+            dynamic.pop(attr, None)
+    return literals, list(dynamic.items())
+
+
 class MergeAttrsNode(template.Node):
     def __init__(self, attributes, default_attrs, append_attrs):
         self.attributes = attributes
         self.default_attrs = default_attrs
         self.append_attrs = append_attrs
+        self.default_literals, self.default_dynamic = split_literal_attributes(default_attrs)
+        self.append_literals, self.append_dynamic = split_literal_attributes(append_attrs)
+        self.default_needs_normalization = needs_normalization(self.default_literals)
 
     def render(self, context):
         bound_attributes: dict = self.attributes.resolve(context)
 
-        default_attrs = {key: value.resolve(context) for key, value in self.default_attrs}
-
-        append_attrs = {key: value.resolve(context) for key, value in self.append_attrs}
-
-        attrs = merge_attributes(
-            default_attrs,
-            bound_attributes,
-        )
-        attrs = append_attributes(attrs, append_attrs)
+        if self.default_attrs:
+            default_attrs = self.default_literals.copy()
+            for key, value in self.default_dynamic:
+                default_attrs[key] = value.resolve(context)
+            if self.default_needs_normalization or (bound_attributes and needs_normalization(bound_attributes)):
+                attrs = merge_attributes(default_attrs, bound_attributes)
+            else:
+                # nothing to normalize, the bound attributes simply override the defaults, and since
+                # default_attrs is our own copy, it can be updated in place
+                if bound_attributes:
+                    default_attrs.update(bound_attributes)
+                attrs = default_attrs
+        elif bound_attributes and needs_normalization(bound_attributes):
+            attrs = merge_attributes(bound_attributes)
+        else:
+            # nothing to merge or normalize, the bound attributes are only read from here on
+            attrs = bound_attributes or {}
+
+        if self.append_attrs:
+            append_attrs = self.append_literals.copy()
+            for key, value in self.append_dynamic:
+                append_attrs[key] = value.resolve(context)
+            attrs = append_attributes(attrs, append_attrs)
 
         return attributes_to_string(attrs)
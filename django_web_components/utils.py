@@ -1,26 +1,23 @@
-import re
-from typing import List
-
-from django.template.base import Parser
-from django.utils.regex_helper import _lazy_re_compile
-
-kwarg_re = _lazy_re_compile(
-    r"""
-    (?:
-        (
-            [\w\-\:\@\.\_]+ # attribute name
-        )
-        =
-    )?
-    (.+) # value
-    """,
-    re.VERBOSE,
-)
-
-
-# This is the same as the original, but the regex is modified to accept
-# special characters
-def token_kwargs(bits: List[str], parser: Parser) -> dict:
+import sys
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from django.template.base import FilterExpression, Parser, Variable
+
+# Besides alphanumeric characters, attribute names may contain these characters
+KWARG_KEY_SPECIAL_CHARS = "_-:@."
+
+# Translation table removing the special characters from an attribute name
+_kwarg_key_special_chars_table = str.maketrans("", "", KWARG_KEY_SPECIAL_CHARS)
+
+# Bare attributes (e.g. `{% #button disabled %}`) are all compiled to this, so they can share the same
+# FilterExpression. It doesn't use any filters, so it doesn't need a parser.
+TRUE_FILTER_EXPRESSION = FilterExpression("True", None)
+
+
+# This is the same as the original, but it accepts special characters
+# in the attribute names
+def token_kwargs(bits: List[str], parser: Parser, allow_bare: bool = False) -> dict:
     """
     Parse token keyword arguments and return a dictionary of the arguments
     retrieved from the ``bits`` token list.
@@ -32,21 +29,89 @@ def token_kwargs(bits: List[str], parser: Parser) -> dict:
     There is no requirement for all remaining token ``bits`` to be keyword
     arguments, so return the dictionary as soon as an invalid argument format
     is reached.
-    """
-    if not bits:
-        return {}
-    match = kwarg_re.match(bits[0])
-    kwarg_format = match and match[1]
-    if not kwarg_format:
-        return {}
 
+    If `allow_bare` is True, bits that are not in the `key=value` form are
+    interpreted as `key=True`.
+    """
     kwargs = {}
     while bits:
-        match = kwarg_re.match(bits[0])
-        if not match or not match[1]:
+        kwarg = _split_kwarg(bits[0], allow_bare)
+        if kwarg is None:
             return kwargs
-        key, value = match.groups()
+        key, value = kwarg
         del bits[:1]
 
-        kwargs[key] = parser.compile_filter(value)
+        # attribute names are long-lived dict keys that are looked up on every render,
+        # so intern them once here
+        kwargs[sys.intern(key)] = TRUE_FILTER_EXPRESSION if value == "True" else compile_filter(value, parser)
     return kwargs
+
+
+def _split_kwarg(bit: str, allow_bare: bool = False) -> Optional[Tuple[str, str]]:
+    """
+    Splits a `key=value` bit into its key and value, or returns None if the bit is not a keyword argument.
+    """
+    key, sep, value = bit.partition("=")
+    if not sep and allow_bare:
+        value = "True"
+    if not key or not value or not is_kwarg_key(key):
+        return None
+    return key, value
+
+
+def is_kwarg_key(key: str) -> bool:
+    """
+    Returns whether the given string is a valid attribute name, i.e. it only contains alphanumeric characters
+    or one of `_-:@.`
+    """
+    if not key:
+        return False
+    # once the special characters are removed, only alphanumeric characters (if any) must be left
+    remaining = key.translate(_kwarg_key_special_chars_table)
+    return not remaining or remaining.isalnum()
+
+
+def compile_filter(token: str, parser: Parser) -> FilterExpression:
+    """
+    Same as `parser.compile_filter`, but plain string literals (e.g. `"foo"`) are compiled only once,
+    and the resulting FilterExpression is shared by all the templates using it.
+    """
+    if is_string_literal(token):
+        return _compile_string_literal(token)
+    return parser.compile_filter(token)
+
+
+def is_string_literal(token: str) -> bool:
+    """
+    Returns whether the given token is a quoted string with no filters applied.
+    """
+    return (
+        len(token) >= 2
+        and token[0] in "\"'"
+        and token[-1] == token[0]
+        and token[0] not in token[1:-1]
+        and "|" not in token
+        and "\\" not in token
+    )
+
+
+def get_literal_value(filter_expression: FilterExpression):
+    """
+    Returns the value of a FilterExpression which doesn't depend on the context (e.g. `"foo"` or `1`),
+    or None if the expression needs to be resolved against the context.
+    """
+    if filter_expression.filters:
+        return None
+    var = filter_expression.var
+    if isinstance(var, Variable):
+        # translated strings depend on the active language
+        if var.lookups is not None or var.translate:
+            return None
+        return var.literal
+    return var
+
+
+@lru_cache(maxsize=1024)
+def _compile_string_literal(token: str) -> FilterExpression:
+    # string literals don't use any filters, so there is no need for the parser
+    return FilterExpression(token, None)
@@ -8,6 +8,9 @@ from django_web_components.attributes import (
     split_attributes,
     normalize_class,
     append_attributes,
+    escape_attribute,
+    escape_attribute_name,
+    needs_normalization,
 )
 
 
@@ -18,6 +21,14 @@ class AttributeBagTest(TestCase):
             'foo="bar"',
         )
 
+    def test_str_of_empty_bag_is_empty_safe_string(self):
+        result = str(AttributeBag())
+        self.assertEqual(result, "")
+        self.assertTrue(type(result) == SafeString)
+
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(AttributeBag(), "__dict__"))
+
 
 class AttributesToStringTest(TestCase):
     def test_simple_attribute(self):
@@ -67,6 +78,40 @@ class AttributesToStringTest(TestCase):
         )
 
 
+class EscapeAttributeTest(TestCase):
+    def test_escapes_special_characters(self):
+        self.assertEqual(
+            escape_attribute("<a href=\"#\">'&'</a>"),
+            "&lt;a href=&quot;#&quot;&gt;&#x27;&amp;&#x27;&lt;/a&gt;",
+        )
+
+    def test_does_not_escape_safe_string(self):
+        self.assertEqual(
+            escape_attribute(mark_safe("<b>")),
+            "<b>",
+        )
+
+    def test_converts_non_strings(self):
+        self.assertEqual(
+            escape_attribute(1),
+            "1",
+        )
+
+
+class EscapeAttributeNameTest(TestCase):
+    def test_does_not_change_safe_names(self):
+        self.assertEqual(
+            escape_attribute_name("x-on:click.prevent"),
+            "x-on:click.prevent",
+        )
+
+    def test_escapes_unsafe_names(self):
+        self.assertEqual(
+            escape_attribute_name('"><script>'),
+            "&quot;&gt;&lt;script&gt;",
+        )
+
+
 class MergeAttributesTest(TestCase):
     def test_merges_attributes(self):
         self.assertEqual(
@@ -86,6 +131,28 @@ class MergeAttributesTest(TestCase):
             {"foo": "bar", "class": "baz qux"},
         )
 
+    def test_normalizes_first_class(self):
+        self.assertEqual(
+            merge_attributes({"class": ["foo", {"bar": True, "baz": False}]}, {"id": "qux"}),
+            {"class": "foo bar", "id": "qux"},
+        )
+
+    def test_skips_none_class(self):
+        self.assertEqual(merge_attributes({"class": None}), {})
+        self.assertEqual(merge_attributes({"id": "foo"}, {"class": None}), {"id": "foo"})
+
+    def test_keeps_class_if_merged_class_is_empty(self):
+        self.assertEqual(
+            merge_attributes({"class": "foo"}, {"class": ""}),
+            {"class": "foo"},
+        )
+
+    def test_strips_whitespace_when_merging_string_classes(self):
+        self.assertEqual(
+            merge_attributes({"class": " foo "}, {"class": "  bar "}, {"class": "   "}),
+            {"class": "foo bar"},
+        )
+
     def test_merge_multiple_dicts(self):
         self.assertEqual(
             merge_attributes(
@@ -100,6 +167,31 @@ class MergeAttributesTest(TestCase):
         result = merge_attributes(AttributeBag({"foo": "bar"}), {})
         self.assertTrue(type(result) == AttributeBag)
 
+    def test_empty_dicts(self):
+        result = merge_attributes({}, {})
+        self.assertEqual(result, {})
+        self.assertTrue(type(result) == AttributeBag)
+
+    def test_single_dict_returns_copy(self):
+        attributes = {"foo": "bar"}
+        result = merge_attributes(attributes)
+        self.assertEqual(result, {"foo": "bar"})
+        self.assertIsNot(result, attributes)
+
+    def test_single_dict_normalizes_classes(self):
+        self.assertEqual(
+            merge_attributes({"class": ["foo", {"bar": True}], "": "baz"}),
+            {"class": "foo bar"},
+        )
+
+
+class NeedsNormalizationTest(TestCase):
+    def test_needs_normalization(self):
+        self.assertTrue(needs_normalization({"class": "foo"}))
+        self.assertTrue(needs_normalization({"": "foo"}))
+        self.assertFalse(needs_normalization({"id": "foo"}))
+        self.assertFalse(needs_normalization({}))
+
 
 class SplitAttributesTest(TestCase):
     def test_returns_normal_attrs(self):
@@ -119,6 +211,11 @@ class AppendAttributesTest(TestCase):
             {"foo": "bar"},
         )
 
+    def test_empty_dicts(self):
+        result = append_attributes({}, {})
+        self.assertEqual(result, {})
+        self.assertTrue(type(result) == AttributeBag)
+
     def test_appends_dicts(self):
         self.assertEqual(
             append_attributes({"class": "foo"}, {"id": "bar"}, {"class": "baz"}),
@@ -157,6 +254,12 @@ class NormalizeClassTest(TestCase):
             "foo",
         )
 
+    def test_strips_dict_keys(self):
+        self.assertEqual(
+            normalize_class({" a": True, "b ": True, " ": True}),
+            "a b",
+        )
+
     def test_combined(self):
         self.assertEqual(
             normalize_class(
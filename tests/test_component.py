@@ -5,9 +5,7 @@ from django.test import TestCase
 
 import django_web_components.attributes
 from django_web_components import component
-from django_web_components.component import (
-    Component,
-)
+from django_web_components.component import Component
 from django_web_components.templatetags.components import SlotNodeList, SlotNode
 
 
@@ -40,6 +38,21 @@ class ComponentTest(TestCase):
             """<div>Hello, world!</div>""",
         )
 
+    def test_renders_first_existing_template_from_list(self):
+        class DummyComponent(Component):
+            template_name = ["missing_template.html", "simple_template.html"]
+
+        self.assertHTMLEqual(
+            DummyComponent().render(
+                Context(
+                    {
+                        "message": "world",
+                    }
+                )
+            ),
+            """<div>Hello, world!</div>""",
+        )
+
 
 class ExampleComponentsTest(TestCase):
     def setUp(self) -> None:
@@ -780,6 +793,20 @@ class RenderComponentTest(TestCase):
             "foo",
         )
 
+    def test_renders_with_empty_context_if_none_passed(self):
+        @component.register("test")
+        def dummy(context):
+            return Template("""{{ attributes.foo }}{{ missing }}""").render(context)
+
+        self.assertEqual(
+            component.render_component(
+                name="test",
+                attributes=django_web_components.attributes.AttributeBag({"foo": "bar"}),
+                slots={},
+            ),
+            "bar",
+        )
+
     def test_passes_context_to_class_component(self):
         @component.register("test")
         class Dummy(component.Component):
@@ -945,3 +972,26 @@ class RegisterTest(TestCase):
             component.registry.get("hello"),
             hello,
         )
+
+    def test_called_with_template_string(self):
+        component.register("hello", template_string="<div>Hello, {{ attributes.name }}!</div>")
+
+        template = Template("""{% #hello name="world" %}""")
+
+        self.assertHTMLEqual(template.render(Context({})), "<div>Hello, world!</div>")
+        self.assertHTMLEqual(template.render(Context({})), "<div>Hello, world!</div>")
+
+    def test_called_with_static_template_string(self):
+        component.register("hello", template_string="<div>Hello, world!</div>")
+
+        self.assertHTMLEqual(Template("""{% #hello %}""").render(Context({})), "<div>Hello, world!</div>")
+
+    def test_raises_if_template_string_is_passed_without_name(self):
+        def hello(context):
+            pass
+
+        with self.assertRaises(ValueError):
+            component.register(template_string="<div></div>")
+
+        with self.assertRaises(ValueError):
+            component.register("hello", hello, template_string="<div></div>")
@@ -0,0 +1,16 @@
+from django.test import TestCase
+
+from django_web_components.conf import app_settings, DEFAULT_SLOT_NAME
+
+
+class AppSettingsTest(TestCase):
+    def test_returns_default_value(self):
+        self.assertEqual(app_settings.DEFAULT_SLOT_NAME, DEFAULT_SLOT_NAME)
+
+    def test_cache_is_cleared_when_settings_change(self):
+        self.assertEqual(app_settings.DEFAULT_SLOT_NAME, DEFAULT_SLOT_NAME)
+
+        with self.settings(WEB_COMPONENTS={"DEFAULT_SLOT_NAME": "default"}):
+            self.assertEqual(app_settings.DEFAULT_SLOT_NAME, "default")
+
+        self.assertEqual(app_settings.DEFAULT_SLOT_NAME, DEFAULT_SLOT_NAME)
@@ -73,3 +73,52 @@ class ComponentRegistryTest(TestCase):
 
         with self.assertRaises(NotRegistered):
             registry.get("hello")
+
+    def test_register_does_not_overwrite_existing_component(self):
+        registry = ComponentRegistry()
+
+        def dummy(context):
+            pass
+
+        def other(context):
+            pass
+
+        registry.register("hello", dummy)
+
+        with self.assertRaises(AlreadyRegistered):
+            registry.register("hello", other)
+
+        self.assertEqual(
+            registry.get("hello"),
+            dummy,
+        )
+
+    def test_unregister_raises_if_component_not_registered(self):
+        registry = ComponentRegistry()
+
+        with self.assertRaises(NotRegistered):
+            registry.unregister("hello")
+
+    def test_get_renderer_returns_renderer_built_by_factory(self):
+        registry = ComponentRegistry(renderer_factory=lambda component: (component,))
+
+        def dummy(context):
+            pass
+
+        registry.register("hello", dummy)
+
+        self.assertEqual(
+            registry.get_renderer("hello"),
+            (dummy,),
+        )
+
+        registry.unregister("hello")
+
+        with self.assertRaises(NotRegistered):
+            registry.get_renderer("hello")
+
+    def test_get_renderer_raises_if_component_not_registered(self):
+        registry = ComponentRegistry(renderer_factory=lambda component: component)
+
+        with self.assertRaises(NotRegistered):
+            registry.get_renderer("hello")
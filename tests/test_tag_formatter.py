@@ -2,7 +2,11 @@ from django.template import Context, Template
 from django.test import TestCase
 
 from django_web_components import component
-from django_web_components.tag_formatter import ComponentTagFormatter
+from django_web_components.tag_formatter import (
+    ComponentTagFormatter,
+    get_component_tag_formatter,
+    get_component_tag_names,
+)
 
 
 class CustomComponentTagFormatter(ComponentTagFormatter):
@@ -63,3 +67,33 @@ class ComponentTagFormatterTest(TestCase):
                 <div>Hello, world!</div>
                 """,
             )
+
+
+class GetComponentTagFormatterTest(TestCase):
+    def test_returns_cached_instance(self):
+        self.assertIs(get_component_tag_formatter(), get_component_tag_formatter())
+
+    def test_cache_is_cleared_when_settings_change(self):
+        with self.settings(
+            WEB_COMPONENTS={
+                "DEFAULT_COMPONENT_TAG_FORMATTER": "tests.test_tag_formatter.CustomComponentTagFormatter",
+            },
+        ):
+            self.assertIsInstance(get_component_tag_formatter(), CustomComponentTagFormatter)
+
+        self.assertNotIsInstance(get_component_tag_formatter(), CustomComponentTagFormatter)
+
+
+class GetComponentTagNamesTest(TestCase):
+    def test_returns_formatted_tag_names(self):
+        self.assertEqual(get_component_tag_names("hello"), ("#hello", "hello", "endhello"))
+
+    def test_uses_configured_formatter(self):
+        with self.settings(
+            WEB_COMPONENTS={
+                "DEFAULT_COMPONENT_TAG_FORMATTER": "tests.test_tag_formatter.CustomComponentTagFormatter",
+            },
+        ):
+            self.assertEqual(get_component_tag_names("hello"), ("_hello", "#hello", "/hello"))
+
+        self.assertEqual(get_component_tag_names("hello"), ("#hello", "hello", "endhello"))
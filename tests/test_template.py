@@ -1,13 +1,16 @@
+import threading
+
 from django.template import Context, Template
 from django.test import TestCase
 
 from django_web_components import component
-from django_web_components.template import template_cache, CachedTemplate
+from django_web_components.template import template_cache, CachedTemplate, compile_template, get_template_compiler
 
 
 class CachedTemplateTest(TestCase):
     def setUp(self) -> None:
         template_cache.clear()
+        get_template_compiler.cache_clear()
         component.registry.clear()
 
     def test_caches_template(self):
@@ -29,6 +32,66 @@ class CachedTemplateTest(TestCase):
         )
         self.assertTrue("test" not in template_cache)
 
+    def test_compiles_anonymous_template_once(self):
+        CachedTemplate("hello").render(Context())
+
+        self.assertEqual(
+            CachedTemplate("hello").render(Context()),
+            "hello",
+        )
+        self.assertEqual(get_template_compiler().cache_info().hits, 1)
+
+    def test_compile_template_reuses_template(self):
+        self.assertIs(compile_template("hello"), compile_template("hello"))
+
+    def test_template_cache_size_setting(self):
+        with self.settings(WEB_COMPONENTS={"TEMPLATE_CACHE_SIZE": 1}):
+            compile_template("hello")
+            compile_template("world")
+
+            self.assertEqual(get_template_compiler().cache_info().maxsize, 1)
+            self.assertEqual(get_template_compiler().cache_info().currsize, 1)
+
+        self.assertEqual(get_template_compiler().cache_info().maxsize, 512)
+
+    def test_discards_least_recently_used_templates(self):
+        with self.settings(WEB_COMPONENTS={"TEMPLATE_CACHE_SIZE": 2}):
+            CachedTemplate("foo", name="foo").render(Context())
+            CachedTemplate("bar", name="bar").render(Context())
+            CachedTemplate("foo", name="foo").render(Context())
+            CachedTemplate("baz", name="baz").render(Context())
+
+            self.assertEqual(list(template_cache), ["foo", "baz"])
+
+    def test_template_cache_size_can_be_unbounded(self):
+        with self.settings(WEB_COMPONENTS={"TEMPLATE_CACHE_SIZE": None}):
+            CachedTemplate("foo", name="foo").render(Context())
+            CachedTemplate("bar", name="bar").render(Context())
+            compile_template("hello")
+
+            self.assertEqual(list(template_cache), ["foo", "bar"])
+            self.assertEqual(get_template_compiler().cache_info().maxsize, None)
+
+    def test_can_be_used_from_multiple_threads(self):
+        errors = []
+
+        def render(offset):
+            try:
+                for i in range(500):
+                    CachedTemplate("hello", name=str((i + offset) % 5)).render(Context())
+            except Exception as e:
+                errors.append(e)
+
+        with self.settings(WEB_COMPONENTS={"TEMPLATE_CACHE_SIZE": 2}):
+            threads = [threading.Thread(target=render, args=(offset,)) for offset in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(template_cache), 2)
+
     def test_uses_cached_template(self):
         template_cache["test"] = cached_template = Template("cached hello")
 
@@ -5,7 +5,13 @@ from django.test import TestCase
 from django_web_components import component
 from django_web_components.attributes import AttributeBag
 from django_web_components.conf import app_settings
-from django_web_components.templatetags.components import SlotNode, SlotNodeList, ComponentNode
+from django_web_components.templatetags.components import (
+    SlotNode,
+    SlotNodeList,
+    ComponentNode,
+    resolved_slot_attributes,
+    split_attribute,
+)
 
 
 class DoComponentTest(TestCase):
@@ -102,6 +108,82 @@ class DoComponentTest(TestCase):
         self.assertEqual(len(node.slots[app_settings.DEFAULT_SLOT_NAME]), 1)
 
 
+class ComponentNodeTest(TestCase):
+    def setUp(self) -> None:
+        component.registry.clear()
+
+    def test_resolves_slot_attributes_per_render(self):
+        @component.register("hello")
+        def dummy(context):
+            return Template("""<div {{ slots.title.attributes }}>{% render_slot slots.title %}</div>""").render(context)
+
+        template = Template(
+            """{% hello %}{% slot title id=object_id %}{{ attributes.id }}{% endslot %}{% endhello %}"""
+        )
+
+        self.assertHTMLEqual(template.render(Context({"object_id": "foo"})), """<div id="foo">foo</div>""")
+        self.assertHTMLEqual(template.render(Context({"object_id": "bar"})), """<div id="bar">bar</div>""")
+
+    def test_does_not_store_resolved_slot_attributes_on_parsed_nodes(self):
+        @component.register("hello")
+        def dummy(context):
+            return Template("""{% render_slot slots.title %}""").render(context)
+
+        template = Template("""{% hello %}{% slot title id="foo" %}{% endslot %}{% endhello %}""")
+        template.render(Context())
+
+        slot = template.nodelist[0].slots["title"][0]
+
+        self.assertEqual(slot.attributes, {})
+
+    def test_resolves_slot_attributes_against_render_context(self):
+        @component.register("lst")
+        def dummy(context):
+            return Template(
+                """{% for i in items %}{% render_slot slots.row i %}{% endfor %}"""
+                """{% with suffix="!" %}{% render_slot slots.footer %}{% endwith %}"""
+            ).render(context)
+
+        template = Template(
+            """{% lst items=items %}"""
+            """{% slot row :let="item" class=item %}<li {{ attributes }}>{{ item }}</li>{% endslot %}"""
+            """{% slot footer title=suffix %}<p {{ attributes }}></p>{% endslot %}"""
+            """{% endlst %}"""
+        )
+
+        self.assertHTMLEqual(
+            template.render(Context({"items": ["a", "b"]})),
+            """<li class="a">a</li><li class="b">b</li><p title="!"></p>""",
+        )
+
+    def test_does_not_set_resolved_slot_attributes_without_slots(self):
+        outer = resolved_slot_attributes.get()
+        seen = []
+
+        @component.register("hello")
+        def dummy(context):
+            seen.append(resolved_slot_attributes.get())
+            return ""
+
+        Template("""{% #hello %}""").render(Context())
+
+        self.assertIs(seen[0], outer)
+        with self.assertRaises(TypeError):
+            outer["foo"] = "bar"
+
+    def test_changes_to_slots_do_not_persist_between_renders(self):
+        @component.register("hello")
+        def dummy(context):
+            context["slots"]["inner_block"].append(TextNode("!"))
+            return Template("""{% render_slot slots.inner_block %}""").render(context)
+
+        template = Template("""{% hello %}Hello{% endhello %}""")
+
+        self.assertEqual(template.render(Context()), "Hello!")
+        self.assertEqual(template.render(Context()), "Hello!")
+        self.assertEqual(len(template.nodelist[0].slots["inner_block"]), 1)
+
+
 class DoSlotTest(TestCase):
     def test_parses_slot(self):
         template = Template("""{% slot title %}{% endslot %}""")
@@ -121,6 +203,17 @@ class DoSlotTest(TestCase):
         self.assertTrue(type(node) == SlotNode)
         self.assertEqual(node.name, "title")
 
+    def test_parses_slot_with_single_quoted_name(self):
+        template = Template("""{% slot 'title' %}{% endslot %}""")
+
+        node = template.nodelist[0]
+
+        self.assertEqual(node.name, "title")
+
+    def test_raises_if_slot_name_is_empty(self):
+        with self.assertRaises(TemplateSyntaxError):
+            Template("""{% slot "" %}{% endslot %}""")
+
     def test_interprets_attributes_with_no_value_as_true(self):
         template = Template("""{% slot title required %}{% endslot %}""")
 
@@ -154,6 +247,53 @@ class DoSlotTest(TestCase):
                 ":let": "user",
             },
         )
+        self.assertEqual(node.let.resolve(context), "user")
+
+    def test_let_is_none_if_not_passed(self):
+        node = Template("""{% slot title %}{% endslot %}""").nodelist[0]
+
+        self.assertIsNone(node.let)
+
+
+class SlotNodeTest(TestCase):
+    def test_render_resolves_attributes(self):
+        node = SlotNode(
+            nodelist=NodeList([VariableNode(FilterExpression("attributes", None))]),
+            unresolved_attributes={"id": FilterExpression("object_id", None)},
+        )
+
+        self.assertEqual(node.render(Context({"object_id": "foo"})), 'id="foo"')
+
+    def test_render_text_only_slot(self):
+        node = Template("""{% slot title %}Hello, world!{% endslot %}""").nodelist[0]
+
+        self.assertEqual(node.static_output, "Hello, world!")
+        self.assertEqual(node.render(Context()), "Hello, world!")
+
+    def test_render_includes_nodes_added_after_creation(self):
+        node = SlotNode(name="title")
+        node.nodelist.append(TextNode("Hello, "))
+        node.nodelist.append(VariableNode(FilterExpression("name", None)))
+
+        self.assertEqual(node.render(Context({"name": "world"})), "Hello, world")
+
+    def test_resolves_literal_and_dynamic_attributes(self):
+        node = SlotNode(
+            unresolved_attributes={
+                "class": FilterExpression('"foo"', None),
+                "id": FilterExpression("object_id", None),
+                "data-x": FilterExpression("1", None),
+            },
+        )
+
+        attributes = node.get_resolved_attributes(Context({"object_id": "bar"}))
+        self.assertEqual(list(attributes.items()), [("class", "foo"), ("id", "bar"), ("data-x", 1)])
+
+        # the resolved attributes can be modified without affecting the next render
+        attributes["class"] = "baz"
+        self.assertEqual(
+            node.get_resolved_attributes(Context({"object_id": "qux"})), {"class": "foo", "id": "qux", "data-x": 1}
+        )
 
 
 class SlotNodeListTest(TestCase):
@@ -189,6 +329,26 @@ class SlotNodeListTest(TestCase):
             {},
         )
 
+    def test_attributes_are_updated_when_the_list_changes(self):
+        node = SlotNode(
+            name="foo",
+            nodelist=NodeList(),
+            unresolved_attributes={},
+            special={},
+            resolved_attributes=AttributeBag({"foo": "bar"}),
+        )
+        nodelist = SlotNodeList()
+        self.assertEqual(nodelist.attributes, {})
+
+        nodelist.append(node)
+        self.assertEqual(nodelist.attributes, {"foo": "bar"})
+
+        nodelist.append(TextNode("hello"))
+        self.assertEqual(nodelist.attributes, {})
+
+        del nodelist[1]
+        self.assertEqual(nodelist.attributes, {"foo": "bar"})
+
 
 class DoRenderSlotTest(TestCase):
     def test_raises_if_no_arguments_passed(self):
@@ -278,6 +438,21 @@ class DoRenderSlotTest(TestCase):
             """,
         )
 
+    def test_renders_text_only_slot_with_argument(self):
+        slot_node = SlotNode(
+            special={
+                ":let": FilterExpression('"user"', None),
+            },
+            nodelist=NodeList([TextNode("Hello, world!")]),
+        )
+
+        self.assertEqual(
+            Template("""{% render_slot inner_block arg %}""").render(
+                Context({"inner_block": SlotNodeList([slot_node]), "arg": "John Doe"})
+            ),
+            "Hello, world!",
+        )
+
 
 class DoMergeAttrsTest(TestCase):
     def test_merges_attributes_with_defaults(self):
@@ -343,3 +518,77 @@ class DoMergeAttrsTest(TestCase):
                 {% merge_attrs attributes foo %}
                 """
             ).render(Context({}))
+
+    def test_normalizes_bound_attributes_without_defaults(self):
+        self.assertEqual(
+            Template(
+                """
+                <div {% merge_attrs attributes %}></div>
+                """
+            )
+            .render(Context({"attributes": {"class": ["foo", {"bar": True, "baz": False}], "id": "x"}}))
+            .strip(),
+            '<div class="foo bar" id="x"></div>',
+        )
+
+    def test_skips_none_class(self):
+        self.assertEqual(
+            Template(
+                """
+                <div {% merge_attrs attributes class=klass %}></div>
+                """
+            )
+            .render(Context({"attributes": AttributeBag({"id": "x"}), "klass": None}))
+            .strip(),
+            '<div id="x"></div>',
+        )
+
+    def test_bound_attributes_override_defaults(self):
+        self.assertEqual(
+            Template(
+                """
+                <div {% merge_attrs attributes id="foo" type="button" %}></div>
+                """
+            )
+            .render(Context({"attributes": {"id": "bar", "": "baz"}}))
+            .strip(),
+            '<div id="bar" type="button"></div>',
+        )
+
+    def test_does_not_modify_bound_attributes(self):
+        attributes = {"id": "foo", "data": "bar"}
+
+        for tag in ["{% merge_attrs attributes %}", '{% merge_attrs attributes data+="baz" %}']:
+            with self.subTest(tag=tag):
+                Template("<div " + tag + "></div>").render(Context({"attributes": attributes}))
+
+                self.assertEqual(attributes, {"id": "foo", "data": "bar"})
+
+    def test_keeps_order_of_literal_and_dynamic_attributes(self):
+        template = Template(
+            """
+            <div {% merge_attrs attributes a="1" b=b c="3" b="2" d=d %}></div>
+            """
+        )
+
+        for i in range(2):
+            with self.subTest(i=i):
+                self.assertEqual(
+                    template.render(Context({"attributes": {}, "b": "x", "d": i})).strip(),
+                    '<div a="1" b="2" c="3" d="%s"></div>' % i,
+                )
+
+
+class SplitAttributeTest(TestCase):
+    def test_splits_attribute(self):
+        self.assertEqual(split_attribute('class="foo"'), ("class", "=", '"foo"'))
+        self.assertEqual(split_attribute("class+=foo"), ("class", "+=", "foo"))
+        self.assertEqual(split_attribute('@click="foo"'), ("@click", "=", '"foo"'))
+
+    def test_falls_back_to_regex_for_inner_quotes(self):
+        self.assertEqual(split_attribute('class="foo"bar'), ("class", "=", '"foo"'))
+
+    def test_returns_none_for_malformed_attributes(self):
+        for pair in ["class", '"class"="foo"', "cl+ass=foo"]:
+            with self.subTest(pair=pair):
+                self.assertIsNone(split_attribute(pair))
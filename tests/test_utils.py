@@ -1,8 +1,16 @@
 from django.template import Context
 from django.template.base import Parser
+from django.template.defaultfilters import register as default_library
 from django.test import TestCase
 
-from django_web_components.utils import token_kwargs
+from django_web_components.utils import (
+    token_kwargs,
+    is_kwarg_key,
+    compile_filter,
+    is_string_literal,
+    get_literal_value,
+    TRUE_FILTER_EXPRESSION,
+)
 
 
 class TokenKwargsTest(TestCase):
@@ -43,3 +51,112 @@ class TokenKwargsTest(TestCase):
                 "foo": "baz",
             },
         )
+
+    def test_parses_value_containing_equal_sign(self):
+        p = Parser([])
+        context = Context()
+
+        self.assertEqual(
+            {key: value.resolve(context) for key, value in token_kwargs(['foo="a=b"'], p).items()},
+            {
+                "foo": "a=b",
+            },
+        )
+
+    def test_stops_at_first_non_kwarg(self):
+        p = Parser([])
+        bits = ['foo="bar"', "baz", 'qux="quux"']
+
+        self.assertEqual(list(token_kwargs(bits, p).keys()), ["foo"])
+        self.assertEqual(bits, ["baz", 'qux="quux"'])
+
+    def test_stops_at_invalid_key(self):
+        p = Parser([])
+
+        self.assertEqual(token_kwargs(['"foo"="bar"'], p), {})
+        self.assertEqual(token_kwargs(["foo="], p), {})
+        self.assertEqual(token_kwargs(["=bar"], p), {})
+
+
+class IsKwargKeyTest(TestCase):
+    def test_valid_keys(self):
+        for key in ["foo", "x-on:click", "@click", "foo:bar.baz", "foo_bar", "données"]:
+            with self.subTest(key=key):
+                self.assertTrue(is_kwarg_key(key))
+
+    def test_invalid_keys(self):
+        for key in ["", '"foo"', "foo bar", "foo|bar", "foo+"]:
+            with self.subTest(key=key):
+                self.assertFalse(is_kwarg_key(key))
+
+
+class TokenKwargsAllowBareTest(TestCase):
+    def test_interprets_bare_bits_as_true(self):
+        p = Parser([])
+        context = Context()
+
+        self.assertEqual(
+            {
+                key: value.resolve(context)
+                for key, value in token_kwargs(["required", 'foo="bar"', "x-on:open"], p, allow_bare=True).items()
+            },
+            {
+                "required": True,
+                "foo": "bar",
+                "x-on:open": True,
+            },
+        )
+
+    def test_stops_at_bare_bits_by_default(self):
+        p = Parser([])
+
+        self.assertEqual(token_kwargs(["required", 'foo="bar"'], p), {})
+
+    def test_shares_true_filter_expression(self):
+        p = Parser([])
+
+        kwargs = token_kwargs(["required", "disabled=True"], p, allow_bare=True)
+
+        self.assertIs(kwargs["required"], TRUE_FILTER_EXPRESSION)
+        self.assertIs(kwargs["disabled"], TRUE_FILTER_EXPRESSION)
+
+
+class CompileFilterTest(TestCase):
+    def test_shares_string_literals(self):
+        p = Parser([])
+
+        self.assertIs(compile_filter('"foo"', p), compile_filter('"foo"', p))
+        self.assertEqual(compile_filter("'foo'", p).resolve(Context()), "foo")
+
+    def test_compiles_variables_and_filters(self):
+        p = Parser([], builtins=[])
+        p.add_library(default_library)
+        context = Context({"foo": "bar"})
+
+        self.assertEqual(compile_filter("foo", p).resolve(context), "bar")
+        self.assertEqual(compile_filter('"foo"|upper', p).resolve(context), "FOO")
+        self.assertIsNot(compile_filter("foo", p), compile_filter("foo", p))
+
+    def test_is_string_literal(self):
+        self.assertTrue(is_string_literal('"foo"'))
+        self.assertTrue(is_string_literal("'foo bar'"))
+        self.assertFalse(is_string_literal("foo"))
+        self.assertFalse(is_string_literal('"foo'))
+        self.assertFalse(is_string_literal('"foo"|upper'))
+        self.assertFalse(is_string_literal('"foo" "bar"'))
+
+
+class GetLiteralValueTest(TestCase):
+    def test_returns_literal_values(self):
+        p = Parser([])
+
+        self.assertEqual(get_literal_value(p.compile_filter('"foo"')), "foo")
+        self.assertEqual(get_literal_value(p.compile_filter("1")), 1)
+
+    def test_returns_none_for_dynamic_values(self):
+        p = Parser([], builtins=[])
+        p.add_library(default_library)
+
+        for token in ["foo", '"foo"|upper', "True"]:
+            with self.subTest(token=token):
+                self.assertIsNone(get_literal_value(p.compile_filter(token)))